@@ -5,20 +5,271 @@
 # Hints:    https://www.blockchain.com/explorer/api/blockchain_api
 #############################################################
 # Import packages
+# requests is the only required package. The optional packages are imported if they are installed:
+# orjson decodes the large API responses faster, aiohttp is needed for the WebSocket API (watch_stream)
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import math
+import threading
+import time
+import weakref
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Decode JSON with orjson if it is installed - Both functions raise a ValueError for an invalid JSON document
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Define Constants
+# Maximum number of concurrent API requests - Limited so that the Blockchain.info API is not flooded
+MAX_CONCURRENT_REQUESTS = 16
+# Number of transactions per page of the transaction data of an address - Maximum of the Blockchain.info API
+TX_PAGE_SIZE = 50
+# Maximum number of kept-alive connections to the Blockchain.info API
+CONNECTION_POOL_SIZE = 32
+# Timeout of an API request in seconds (connect timeout, read timeout)
+REQUEST_TIMEOUT = (3.05, 30)
+# Time in seconds for which a retrieved list of unconfirmed transactions is reused
+MEMPOOL_CACHE_TTL_SECONDS = 10
+# Upper limit of the reuse time - A list of unconfirmed transactions that is reused for too long hides new transactions
+MAX_MEMPOOL_CACHE_TTL_SECONDS = 60
+# Interval in seconds in which the WebSocket connection to the Blockchain.info API is kept alive
+WEBSOCKET_HEARTBEAT_SECONDS = 30
+
+
+#############################################################
+# @brief    This function creates the HTTP session that is shared by all API requests.
+#           The session keeps the connections to the API alive, so that not every
+#           request has to pay for a new TCP and TLS handshake.
+#
+# @return   session - HTTP session with connection pooling and retries
+# @author   criticalEntropy
+# @date     15.10.2026
+#############################################################
+def _create_session():
+    session = requests.Session()
+
+    # Retry failed connection attempts and requests that were rate-limited or failed on the server side
+    # The waiting time doubles with each retry, so that a rate limit of the API can recover
+    retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], allowed_methods=["GET"])
+
+    # Reuse pooled connections
+    adapter = HTTPAdapter(pool_connections=CONNECTION_POOL_SIZE, pool_maxsize=CONNECTION_POOL_SIZE, max_retries=retry)
+    session.mount("https://", adapter)
+
+    return session
+
+
+#############################################################
+# @brief    This function requests a JSON document from the Blockchain.info API.
+#           HTTP errors that remain after all retries raise a requests.exceptions.RequestException.
+#
+# @para     session - HTTP session used for the API request
+# @para     api_url - URL of the API request
+# @return   dict - The API response as JSON dictionary
+# @author   criticalEntropy
+# @date     15.10.2026
+#############################################################
+def _get_json(session, api_url):
+    # Make sure that the API call was successful and no HTTP errors occurred
+    response = session.get(api_url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+
+    # Parse the response as a JSON dictionary
+    return _json_loads(response.content)
+
+
+# Shared HTTP session of all monitoring objects
+_session = _create_session()
+
+
+class _MempoolCache:
+    # Constructor
+    def __init__(self):
+        self.timestamp = None
+
+        # Addresses that send or receive bitcoin in the cached list of unconfirmed transactions
+        self.sender_addresses = frozenset()
+        self.recipient_addresses = frozenset()
+
+        # Validators of the cached list - Allow the API to answer with "304 Not Modified" if the list is unchanged
+        self.etag = None
+        self.last_modified = None
+
+        # Concurrent checks wait for a running refresh instead of requesting the memory pool themselves
+        self.lock = threading.Lock()
+
+
+# Cached lists of unconfirmed transactions of the HTTP sessions
+# Each session has its own cache, because sessions can use different proxies or endpoints.
+# The cache of a session is discarded together with the session.
+_mempool_caches = weakref.WeakKeyDictionary()
+_mempool_caches_lock = threading.Lock()
+
+
+#############################################################
+# @brief    This function returns the cached list of unconfirmed transactions of an HTTP session.
+#
+# @para     session - HTTP session used for the API request
+# @return   _MempoolCache - The cache of the session
+# @author   criticalEntropy
+# @date     15.10.2026
+#############################################################
+def _get_mempool_cache(session):
+    with _mempool_caches_lock:
+        mempool_cache = _mempool_caches.get(session)
+        if mempool_cache is None:
+            mempool_cache = _mempool_caches[session] = _MempoolCache()
+
+        return mempool_cache
+
+
+#############################################################
+# @brief    This function makes sure that the cache time of the memory pool is valid.
+#           The cached memory pool must neither become stale nor be disabled.
+#
+# @para     ttl - Time in seconds for which the cached memory pool is reused
+# @author   criticalEntropy
+# @date     15.10.2026
+#############################################################
+def _check_mempool_ttl(ttl):
+    if not 0 < ttl <= MAX_MEMPOOL_CACHE_TTL_SECONDS:
+        raise ValueError(f"The cache time must be between 0 and {MAX_MEMPOOL_CACHE_TTL_SECONDS} seconds: {ttl}")
+
+
+#############################################################
+# @brief    This function requests the list of unconfirmed transactions from the Blockchain.info API
+#           and indexes the addresses that send or receive bitcoin.
+#           The index is cached per session for a short time, so that consecutive checks of the memory pool
+#           share one API request and answer each monitored address with a set lookup.
+#
+# @para     session - HTTP session used for the API request
+# @para     ttl - Time in seconds for which the cached index is reused
+# @return   tuple - Two sets of addresses
+#                   -> addresses that sent bitcoin
+#                   -> addresses that received bitcoin
+# @author   criticalEntropy
+# @date     15.10.2026
+#############################################################
+def _get_mempool_addresses(session, ttl):
+    mempool_cache = _get_mempool_cache(session)
+
+    with mempool_cache.lock:
+        # Request the list of unconfirmed transactions again if the cached index is missing or expired
+        if mempool_cache.timestamp is None or time.monotonic() - mempool_cache.timestamp >= ttl:
+            # Ask the API to only send the list of unconfirmed transactions if it has changed since the last request
+            headers = {}
+            if mempool_cache.etag:
+                headers['If-None-Match'] = mempool_cache.etag
+            if mempool_cache.last_modified:
+                headers['If-Modified-Since'] = mempool_cache.last_modified
+
+            # Send an HTTP request to the Blockchain.info API to retrieve the list of unconfirmed transactions
+            api_url = 'https://blockchain.info/unconfirmed-transactions?format=json'
+            response = session.get(api_url, headers=headers, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+
+            # Keep the cached index if the list of unconfirmed transactions has not changed
+            if response.status_code == 304:
+                mempool_cache.timestamp = time.monotonic()
+                return mempool_cache.sender_addresses, mempool_cache.recipient_addresses
+
+            # Parse the response as a JSON dictionary
+            unconfirmed_transactions = _json_loads(response.content)['txs']
+
+            # Index the address of the first input and the addresses of all outputs of each transaction
+            sender_addresses = {transaction['inputs'][0].get('prev_out', {}).get('addr')
+                                for transaction in unconfirmed_transactions if transaction.get('inputs')}
+            recipient_addresses = {output.get('addr')
+                                   for transaction in unconfirmed_transactions for output in transaction.get('out', [])}
+
+            # Inputs and outputs without an address are not indexed
+            sender_addresses.discard(None)
+            recipient_addresses.discard(None)
+
+            mempool_cache.sender_addresses = frozenset(sender_addresses)
+            mempool_cache.recipient_addresses = frozenset(recipient_addresses)
+            mempool_cache.etag = response.headers.get('ETag')
+            mempool_cache.last_modified = response.headers.get('Last-Modified')
+            mempool_cache.timestamp = time.monotonic()
+
+        return mempool_cache.sender_addresses, mempool_cache.recipient_addresses
 
 
 class BtcAddressMonitoring:
+    # Attributes - Objects without an attribute dictionary need less memory when many addresses are monitored
+    __slots__ = ("watch_address", "transaction_list", "_session", "_mempool_ttl")
+
     # Constructor
-    def __init__(self, watch_address):
+    # An existing requests.Session can be passed to share its connection pool, retries and proxies with
+    # the rest of an application. By default, all monitoring objects share one session of this module.
+    # The memory pool is reused for mempool_ttl seconds by all checks (at most MAX_MEMPOOL_CACHE_TTL_SECONDS).
+    def __init__(self, watch_address, session=None, mempool_ttl=MEMPOOL_CACHE_TTL_SECONDS):
+        # Make sure that an invalid cache time is reported here and not hidden by the error handling of the checks
+        _check_mempool_ttl(mempool_ttl)
+
         self.watch_address = watch_address
+        self._session = session or _session
+        self._mempool_ttl = mempool_ttl
 
         self.transaction_list = []
-        self.matrix = []
 
-    # Destructor
-    def __del__(self):
-        print(f"Deleting BtcAddressMonitoring object with watch_address {self.watch_address}")
+    #############################################################
+    # @brief    This function scans the memory pool once for several bitcoin addresses.
+    #           Monitoring many addresses therefore needs only one API request and one pass
+    #           over the unconfirmed transactions instead of one per address.
+    #
+    # @para     watch_addresses - Set of addresses to be monitored
+    # @para     session - HTTP session used for the API request (optional)
+    # @para     ttl - Time in seconds for which the cached memory pool is reused (optional)
+    # @return   tuple - Two dictionaries that map each monitored address to a boolean
+    #                   -> BTC sent from monitored address?
+    #                   -> BTC received by monitored address?
+    # @author   criticalEntropy
+    # @date     15.10.2026
+    #############################################################
+    @classmethod
+    def scan_mempool(cls, watch_addresses, session=None, ttl=MEMPOOL_CACHE_TTL_SECONDS):
+        # Make sure that the cache time is valid
+        _check_mempool_ttl(ttl)
+
+        # Retrieve the addresses that send or receive bitcoin in the memory pool
+        sender_addresses, recipient_addresses = _get_mempool_addresses(session or _session, ttl)
+
+        # Look up each monitored address in the memory pool
+        tx_hits = {watch_address: watch_address in sender_addresses for watch_address in watch_addresses}
+        rx_hits = {watch_address: watch_address in recipient_addresses for watch_address in watch_addresses}
+
+        return tx_hits, rx_hits
+
+    #############################################################
+    # @brief    This function scans the memory pool for the monitored bitcoin address.
+    #           The function returns 'False' for both directions if the memory pool could not be scanned.
+    #
+    # @return   tuple - BTC sent from / received by monitored address?
+    # @author   criticalEntropy
+    # @date     15.10.2026
+    #############################################################
+    def _scan_watch_address(self):
+        # Make sure that the API call was successful and the response could be parsed correctly
+        # The list of unconfirmed transactions is shared with the other checks of the memory pool for a short time
+        try:
+            tx_hits, rx_hits = self.scan_mempool({self.watch_address}, self._session, self._mempool_ttl)
+        except requests.exceptions.RequestException as err:
+            print(f"An error occurred while trying to retrieve the list of unconfirmed transactions: {err}")
+            return False, False
+        except ValueError as err:
+            print(f"An error occurred while parsing the response as a JSON dictionary: {err}")
+            return False, False
+        except (KeyError, IndexError, AttributeError) as err:
+            print("An error occurred while parsing the API response:", err)
+            return False, False
+
+        return tx_hits[self.watch_address], rx_hits[self.watch_address]
 
     #############################################################
     # @brief    This function monitors a bitcoin address and returns 'True' in
@@ -34,39 +285,8 @@ class BtcAddressMonitoring:
     # @date     23.12.2022
     #############################################################
     def is_tx_transaction_from_btc_address(self):
-        # Send an HTTP request to the Blockchain.info API to retrieve the list of unconfirmed transactions
-        api_url = 'https://blockchain.info/unconfirmed-transactions?format=json'
-
-        # Make sure that the API call was successful and no HTTP errors occurred
-        try:
-            response = requests.get(api_url)
-            response.raise_for_status()
-        except (requests.exceptions.RequestException, ValueError) as err:
-            print(f"An error occurred while trying to retrieve the list of unconfirmed transactions: {err}")
-            return False
-
-        # Make sure that the response of the API call could be parsed correctly
-        try:
-            # Parse the response as a JSON dictionary
-            unconfirmed_transactions = response.json()
-        except ValueError as err:
-            print(f"An error occurred while parsing the response as a JSON dictionary: {err}")
-            return False
-
-        # Make sure that the API response object has the expected format and that the required keys are present.
-        try:
-            # Iterate over each unconfirmed transaction
-            for transaction in unconfirmed_transactions['txs']:
-                # Check if the address to be monitored has sent bitcoin
-                if transaction['inputs'][0]['prev_out']['addr'] == self.watch_address:
-                    # BTC was sent
-                    return True
-        except (KeyError, IndexError) as err:
-            print("An error occurred while parsing the API response:", err)
-            return False
-
-        # Return False if the monitored address has not sent any BTC
-        return False
+        # Return True if the monitored address has sent BTC
+        return self._scan_watch_address()[0]
 
     #############################################################
     # @brief    This function monitors a bitcoin address and returns 'True' in
@@ -82,40 +302,70 @@ class BtcAddressMonitoring:
     # @date     23.12.2022
     #############################################################
     def is_rx_transaction_to_btc_address(self):
-        # Send an HTTP request to the Blockchain.info API to retrieve the list of unconfirmed transactions
-        api_url = 'https://blockchain.info/unconfirmed-transactions?format=json'
+        # Return True if the monitored address has received BTC
+        return self._scan_watch_address()[1]
 
-        # Make sure that the API call was successful and no HTTP errors occurred
-        try:
-            response = requests.get(api_url)
-            response.raise_for_status()
-        except (requests.exceptions.RequestException, ValueError) as err:
-            print(f"An error occurred while trying to retrieve the list of unconfirmed transactions: {err}")
-            return False
+    #############################################################
+    # @brief    This function subscribes to the unconfirmed transactions of the Blockchain.info WebSocket API
+    #           and yields every new transaction that sends BTC from or to the monitored bitcoin address.
+    #           In contrast to periodically checking the memory pool, no transaction is missed between two
+    #           checks and the memory pool does not have to be downloaded again and again.
+    #           The subscription never ends by itself. A connection error or a connection that is closed
+    #           by the server raises an exception, so that the caller can reconnect.
+    #           Note that the package aiohttp is required for this function.
+    #
+    # @para     client_session - aiohttp.ClientSession used for the connection (optional)
+    #                            A passed session is not closed by this function
+    # @return   tuple - Information about each matching unconfirmed transaction
+    #                   -> boolean - BTC sent from monitored address?
+    #                   -> boolean - BTC received by monitored address?
+    #                   -> dict - The transaction as JSON dictionary
+    # @author   criticalEntropy
+    # @date     15.10.2026
+    #############################################################
+    async def watch_stream(self, client_session=None):
+        # The package is only needed for the WebSocket API
+        import aiohttp
 
-        # Make sure that the response of the API call could be parsed correctly.
-        try:
-            # Parse the response as a JSON dictionary
-            unconfirmed_transactions = response.json()
-        except ValueError as err:
-            print(f"An error occurred while parsing the response as a JSON dictionary: {err}")
-            return False
+        # Create a client session if none was passed - It is closed again when the connection ends
+        own_client_session = client_session is None
+        if own_client_session:
+            client_session = aiohttp.ClientSession()
 
-        # Make sure that the response of the API call could be parsed correctly
         try:
-            # Iterate over each unconfirmed transaction
-            for transaction in unconfirmed_transactions['txs']:
-                for output in transaction['out']:
-                    # Check if the address to be monitored has received bitcoin
-                    if 'addr' in output and output['addr'] == self.watch_address:
-                        # BTC received
-                        return True
-        except (KeyError, IndexError) as err:
-            print("An error occurred while parsing the API response:", err)
-            return False
-
-        # Return False if the monitored address has not received any BTC
-        return False
+            async with client_session.ws_connect('wss://ws.blockchain.info/inv',
+                                                 heartbeat=WEBSOCKET_HEARTBEAT_SECONDS) as websocket:
+                # Subscribe to the notifications about new unconfirmed transactions
+                await websocket.send_json({"op": "unconfirmed_sub"})
+
+                # Iterate over each notification until the connection is closed
+                async for message in websocket:
+                    # Report a failed connection - No further notifications arrive after an error
+                    if message.type == aiohttp.WSMsgType.ERROR:
+                        raise websocket.exception()
+                    if message.type != aiohttp.WSMsgType.TEXT:
+                        continue
+
+                    # Parse the notification as a JSON dictionary and skip all notifications without a transaction
+                    notification = _json_loads(message.data)
+                    if notification.get("op") != "utx":
+                        continue
+                    transaction = notification["x"]
+
+                    # Check if the address to be monitored has sent or received bitcoin
+                    inputs = transaction.get('inputs')
+                    is_tx = bool(inputs) and inputs[0].get('prev_out', {}).get('addr') == self.watch_address
+                    is_rx = any(output.get('addr') == self.watch_address for output in transaction.get('out', []))
+
+                    if is_tx or is_rx:
+                        yield is_tx, is_rx, transaction
+
+                # The notifications end only if the server has closed the connection
+                raise ConnectionError(f"The WebSocket connection was closed by the server "
+                                      f"(code {websocket.close_code})")
+        finally:
+            if own_client_session:
+                await client_session.close()
 
     #############################################################
     # @brief    This function requests the outgoing transaction of a Bitcoin address
@@ -131,20 +381,34 @@ class BtcAddressMonitoring:
     #############################################################
 
     def get_transactions_from_btc_address(self):
-        # Set the number of data packets to 500 per page - A large number was chosen so that Api requests can be reduced
-        tx_page = 500
-
-        # Add the page parameter to the API URL
-        api_url = f"https://blockchain.info/rawaddr/{self.watch_address}?limit={tx_page}"
-
-        # Make an API request to get the transaction data for the specified address
-        response = requests.get(api_url)
-
-        # Check if the API request was successful
-        if response.ok:
-            # Get the transaction data from the API response
-            data = response.json()
+        # Initialize the list of transactions
+        self.transaction_list = []
 
+        # Make sure that all API calls were successful and no HTTP errors occurred
+        try:
+            # Make an API request to get the first page of transaction data for the specified address
+            pages = [self.get_btc_address_page(0)]
+
+            # Request the remaining pages concurrently - The first page contains the total number of transactions
+            page_count = math.ceil(pages[0].get("n_tx", 0) / TX_PAGE_SIZE)
+            if page_count > 1:
+                with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                    futures = [executor.submit(self.get_btc_address_page, page) for page in range(1, page_count)]
+                    try:
+                        # Collect the pages in the order of the page numbers
+                        pages.extend(future.result() for future in futures)
+                    except Exception:
+                        # Cancel the pending pages - The list of transactions is incomplete anyway
+                        executor.shutdown(cancel_futures=True)
+                        raise
+        except requests.exceptions.RequestException as err:
+            print(f"An error occurred while trying to retrieve the transactions of the address: {err}")
+
+            # Return an empty list in case of an error instead of an incomplete list
+            return self.transaction_list
+
+        # Iterate over the pages of transaction data
+        for data in pages:
             # Check if the API response contains transaction data
             if "txs" in data:
                 # Iterate over the transactions in the API response
@@ -160,32 +424,105 @@ class BtcAddressMonitoring:
                         if from_address and to_address and amount:
                             # Add the transaction data to the list
                             self.transaction_list.append((from_address, to_address, amount))
-        else:
-            # Handle the error here
-            self.transaction_list = []
-            pass
 
         # Return the list of transactions
         return self.transaction_list
 
+    #############################################################
+    # @brief    This function requests one page of the transaction data of a Bitcoin address
+    #           from the Blockchain.info API.
+    #
+    # @para     page - Number of the page, starting with 0
+    # @return   dict - The transaction data of the page as JSON dictionary
+    # @author   criticalEntropy
+    # @date     15.10.2026
+    #############################################################
+    def get_btc_address_page(self, page):
+        # Add the page parameters to the API URL
+        api_url = (f"https://blockchain.info/rawaddr/{self.watch_address}"
+                   f"?limit={TX_PAGE_SIZE}&offset={page * TX_PAGE_SIZE}")
+
+        # Make an API request to get the transaction data for the specified address
+        return _get_json(self._session, api_url)
+
+
+class _TransactionMatrix(Sequence):
+    # Constructor
+    # The matrix is a view of the columns - It does not copy the transaction data and creates each row on access
+    def __init__(self, sender_addresses, recipient_addresses, amounts):
+        self._columns = (sender_addresses, recipient_addresses, amounts)
+
+    def __len__(self):
+        return len(self._columns[0])
+
+    def __getitem__(self, index):
+        # A slice of the matrix is returned as a list of rows
+        if isinstance(index, slice):
+            return list(zip(*(column[index] for column in self._columns)))
+
+        return tuple(column[index] for column in self._columns)
+
+    def __iter__(self):
+        return zip(*self._columns)
+
+    def __repr__(self):
+        return repr(list(self))
+
 
 class BtcBlockMonitoring:
+    # Attributes - Objects without an attribute dictionary need less memory
+    __slots__ = ("start_block", "end_block", "sender_addresses", "recipient_addresses", "amounts", "_session")
+
     # Constructor
-    def __init__(self, start_block, end_block):
+    # An existing requests.Session can be passed to share its connection pool, retries and proxies with
+    # the rest of an application. By default, all monitoring objects share one session of this module.
+    def __init__(self, start_block, end_block, session=None):
         self.start_block = start_block
         self.end_block = end_block
+        self._session = session or _session
 
-        self.matrix = []
+        # Store the transaction data column by column - The amounts are kept as compact 64-bit integers
+        self.sender_addresses = []
+        self.recipient_addresses = []
+        self.amounts = array('q')
+
+    #############################################################
+    # @brief    This function returns the transaction data row by row.
+    #           The rows are created from the columns on access, so no rows are stored.
+    #           The matrix supports len(), indexing and iterating like a list of rows.
+    #
+    # @return   sequence - The rows containing the transaction information of the block range
+    #                   -> transmitter address
+    #                   -> receiver address
+    #                   -> transaction amount in *10^-8 btc
+    # @author   criticalEntropy
+    # @date     15.10.2026
+    #############################################################
+    @property
+    def matrix(self):
+        return _TransactionMatrix(self.sender_addresses, self.recipient_addresses, self.amounts)
 
-    # Destructor
-    def __del__(self):
-        print(f"Deleting BtcAddressMonitoring object with block {self.end_block}")
+    #############################################################
+    # @brief    This function returns the transaction data column by column.
+    #
+    # @return   tuple - Three columns containing the transaction information of the block range
+    #                   -> transmitter addresses
+    #                   -> receiver addresses
+    #                   -> transaction amounts in *10^-8 btc (array of 64-bit integers)
+    # @author   criticalEntropy
+    # @date     15.10.2026
+    #############################################################
+    def columns(self):
+        return self.sender_addresses, self.recipient_addresses, self.amounts
 
     #############################################################
     # @brief    This function checks if a bitcoin address is potentially involved in mixing bitcoin
+    #           Each input of a CoinJoin transaction is paired with each of its outputs. The value of an output
+    #           is split among the inputs in proportion to the value that each input contributed.
+    #           If a block cannot be retrieved after all retries or its response cannot be parsed, the exception
+    #           is raised and no transactions of the block range are stored, so that the result is never incomplete.
     #
-    # @para     watch_address - Address to be monitored
-    # @return   list - A list containing the transaction information of a Bitcoin address
+    # @return   sequence - The rows containing the transaction information of the block range (see matrix)
     #                   -> transmitter address
     #                   -> receiver address
     #                   -> transaction amount in *10^-8 btc
@@ -195,49 +532,87 @@ class BtcBlockMonitoring:
 
     def get_mixed_btc_transactions_from_btc_blocks(self):
 
+        # Initialize a dictionary to store the transaction data of each block
+        block_transactions = {}
+
+        # Request all blocks of the block range concurrently
+        # The API calls are I/O-bound, so the round-trip times overlap instead of adding up block by block
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            # Each block is parsed by the thread that requested it, so only the CoinJoin transactions of a block
+            # are kept and the block data is released as soon as it has been parsed
+            futures = {executor.submit(self.get_mixed_btc_transactions_from_btc_block, block_num): block_num
+                       for block_num in range(self.start_block, self.end_block + 1)}
+
+            # Collect the transaction data of each block as soon as it is available
+            try:
+                for future in as_completed(futures):
+                    block_transactions[futures[future]] = future.result()
+            except Exception as err:
+                if isinstance(err, requests.exceptions.RequestException):
+                    print(f"An error occurred while trying to retrieve block {futures[future]}: {err}")
+
+                # Cancel the pending blocks - The transaction data of the block range is incomplete anyway
+                executor.shutdown(cancel_futures=True)
+                raise
+
+        # Add the transactions of the blocks to the columns in the order of the block range
+        for block_num in sorted(block_transactions):
+            sender_addresses, recipient_addresses, amounts = block_transactions[block_num]
+            self.sender_addresses.extend(sender_addresses)
+            self.recipient_addresses.extend(recipient_addresses)
+            self.amounts.extend(amounts)
+
+        # Return the rows of the transaction data
+        return self.matrix
+
+    #############################################################
+    # @brief    This function requests a bitcoin block from the Blockchain.info API
+    #           and extracts its CoinJoin transactions.
+    #
+    # @para     block_num - Height of the block to be requested
+    # @return   tuple - Three lists containing the transaction information of the block
+    #                   -> transmitter addresses
+    #                   -> receiver addresses
+    #                   -> transaction amounts in *10^-8 btc
+    # @author   criticalEntropy
+    # @date     15.10.2026
+    #############################################################
+    def get_mixed_btc_transactions_from_btc_block(self, block_num):
+
         # Initialize lists to store the transaction data
         sender_addresses = []
         recipient_addresses = []
         amounts = []
 
-        # Iterate over the block range
-        for block_num in range(self.start_block, self.end_block + 1):
-            # Make an API request to get the block data
-            response = requests.get(f"https://blockchain.info/rawblock/{block_num}")
-
-            # Check if the API request was successful
-            if response.ok:
-                # Get the block data from the API response
-                block_data = response.json()
-
-                # Iterate over the transactions in the block
-                for tx in block_data["tx"]:
-                    # Check if the transaction is a CoinJoin
-                    if len(tx["inputs"]) > 1 and len(tx["out"]) > 1:
-                        # Iterate over the inputs in the transaction
-                        for input_data in tx["inputs"]:
-                            # Get the sender address and amount
-                            sender_address = input_data["prev_out"]["addr"]
-                            amount = input_data["prev_out"]["value"]
-
-                            # Add the sender address and amount to the lists
-                            sender_addresses.append(sender_address)
-                            amounts.append(amount)
-
-                        # Iterate over the outputs in the transaction
-                        for output_data in tx["out"]:
-                            # Get the recipient address and amount
-                            recipient_address = output_data["addr"]
-                            recipient_addresses.append(recipient_address)
-                            amount = output_data["value"]
-
-        # Iterate over the sender addresses
-        for i in range(len(sender_addresses)):
-            # Create a list for the current transaction
-            transaction = [sender_addresses[i], recipient_addresses[i], amounts[i]]
-
-            # Add the transaction to the matrix
-            self.matrix.append(transaction)
-
-        # Return the matrix
-        return self.matrix
+        # Make an API request to get the block data
+        block_data = _get_json(self._session, f"https://blockchain.info/rawblock/{block_num}")
+
+        # Filter the CoinJoin transactions of the block - Only transactions with several inputs and outputs
+        # are considered, so the inputs and outputs of all other transactions are never touched
+        coinjoin_transactions = (tx for tx in block_data["tx"] if len(tx["inputs"]) > 1 and len(tx["out"]) > 1)
+
+        # Iterate over the CoinJoin transactions
+        for tx in coinjoin_transactions:
+            # Get the sender addresses and amounts of the inputs
+            inputs = [(input_data["prev_out"]["addr"], input_data["prev_out"]["value"])
+                      for input_data in tx["inputs"] if "addr" in input_data["prev_out"]]
+
+            # Get the recipient addresses and amounts of the outputs
+            outputs = [(output_data["addr"], output_data["value"])
+                       for output_data in tx["out"] if "addr" in output_data]
+
+            # Skip the transaction if no value can be split among the inputs
+            input_value = sum(amount for _, amount in inputs)
+            if input_value == 0:
+                continue
+
+            # Pair each input with each output
+            sender_addresses.extend(sender_address for sender_address, _ in inputs for _ in outputs)
+            recipient_addresses.extend(recipient_address for _ in inputs for recipient_address, _ in outputs)
+
+            # Split the value of each output among the inputs in proportion to their value
+            amounts.extend(output_amount * input_amount // input_value
+                           for _, input_amount in inputs for _, output_amount in outputs)
+
+        # Return the transaction data of the block
+        return sender_addresses, recipient_addresses, amounts
@@ -4,23 +4,72 @@
 # @date     23.12.2022
 #############################################################
 
+import asyncio
+import time
 import unittest
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
-from btc_parser import BtcAddressMonitoring
+from btc_parser import BtcAddressMonitoring, _get_mempool_cache, _mempool_caches, _session
+import aiohttp
+import orjson
 import requests
 
+
+# WebSocket connection that replays a list of messages and is then closed by the server
+class FakeWebSocket:
+    def __init__(self, messages, error=None):
+        self.messages = messages
+        self.error = error
+        self.sent = []
+        self.close_code = 1000
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+    async def __aiter__(self):
+        for message in self.messages:
+            yield message
+
+    def exception(self):
+        return self.error
+
+
+# Client session that opens a FakeWebSocket
+class FakeClientSession:
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.closed = False
+
+    def ws_connect(self, url, **kwargs):
+        return self.websocket
+
+    async def close(self):
+        self.closed = True
+
+
+# Create a WebSocket message with a notification about an unconfirmed transaction
+def utx_message(transaction):
+    return SimpleNamespace(type=aiohttp.WSMsgType.TEXT, data=orjson.dumps({"op": "utx", "x": transaction}).decode())
+
+
 # Create an instance of the BtcAddressMonitoring class
 test_monitor = BtcAddressMonitoring('watch_address')
 
 
 class TestBtcAddressMonitoring(unittest.TestCase):
 
-    @patch('requests.get')
+    @patch('btc_parser._session.get')
     def test_is_tx_transaction_from_btc_address(self, mock_get):
         # Set up the mock response to return a JSON dictionary with a transaction
         # where the watchAddress sends BTC
-        mock_get.return_value.json.return_value = {
+        mock_get.return_value.content = orjson.dumps({
             'txs': [{
                 'inputs': [{
                     'prev_out': {
@@ -28,7 +77,7 @@ class TestBtcAddressMonitoring(unittest.TestCase):
                     }
                 }]
             }]
-        }
+        })
 
         # Call the function with the watchAddress
         result = test_monitor.is_tx_transaction_from_btc_address()
@@ -36,17 +85,17 @@ class TestBtcAddressMonitoring(unittest.TestCase):
         # Assert that the function returns True
         self.assertTrue(result)
 
-    @patch('requests.get')
+    @patch('btc_parser._session.get')
     def test_is_rx_transaction_to_btc_address(self, mock_get):
         # Set up the mock response to return a JSON dictionary with a transaction
         # where the watchAddress receives BTC
-        mock_get.return_value.json.return_value = {
+        mock_get.return_value.content = orjson.dumps({
             'txs': [{
                 'out': [{
                     'addr': 'watch_address'
                 }]
             }]
-        }
+        })
 
         # Call the function with the watchAddress
         result = test_monitor.is_rx_transaction_to_btc_address()
@@ -54,11 +103,11 @@ class TestBtcAddressMonitoring(unittest.TestCase):
         # Assert that the function returns True
         self.assertTrue(result)
 
-    @patch('requests.get')
+    @patch('btc_parser._session.get')
     def test_does_not_send_or_receive_btc(self, mock_get):
         # Set up the mock response to return a JSON dictionary with a transaction
         # where the watchAddress does not send or receive BTC
-        mock_get.return_value.json.return_value = {
+        mock_get.return_value.content = orjson.dumps({
             'txs': [{
                 'inputs': [{
                     'prev_out': {
@@ -69,7 +118,7 @@ class TestBtcAddressMonitoring(unittest.TestCase):
                     'addr': 'other_address'
                 }]
             }]
-        }
+        })
 
         # Call the functions with the watchAddress
         tx_result = test_monitor.is_tx_transaction_from_btc_address()
@@ -79,7 +128,206 @@ class TestBtcAddressMonitoring(unittest.TestCase):
         self.assertFalse(tx_result)
         self.assertFalse(rx_result)
 
-    @patch('requests.get')
+    @patch('btc_parser._session.get')
+    def test_unconfirmed_transactions_are_shared(self, mock_get):
+        # Set up the mock response to return a JSON dictionary with a transaction
+        # where the watchAddress sends and receives BTC
+        mock_get.return_value.content = orjson.dumps({
+            'txs': [{
+                'inputs': [{
+                    'prev_out': {
+                        'addr': 'watch_address'
+                    }
+                }],
+                'out': [{
+                    'addr': 'watch_address'
+                }]
+            }]
+        })
+
+        # Call the functions with the watchAddress
+        tx_result = test_monitor.is_tx_transaction_from_btc_address()
+        rx_result = test_monitor.is_rx_transaction_to_btc_address()
+
+        # Assert that the functions return True and that the list of unconfirmed transactions was requested once
+        self.assertTrue(tx_result)
+        self.assertTrue(rx_result)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch('btc_parser._session.get')
+    def test_unchanged_unconfirmed_transactions(self, mock_get):
+        # Set up the mock response to return a JSON dictionary with a transaction
+        # where the watchAddress sends BTC, together with the ETag of the list
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {'ETag': '"mempool-1"'}
+        mock_get.return_value.content = orjson.dumps({
+            'txs': [{
+                'inputs': [{
+                    'prev_out': {
+                        'addr': 'watch_address'
+                    }
+                }]
+            }]
+        })
+        first_result = test_monitor.is_tx_transaction_from_btc_address()
+
+        # Let the cached list expire and set up the mock response to report an unchanged list
+        _get_mempool_cache(_session).timestamp = None
+        mock_get.return_value.status_code = 304
+        mock_get.return_value.content = b''
+        second_result = test_monitor.is_tx_transaction_from_btc_address()
+
+        # Assert that the list was requested conditionally and that the cached list was reused
+        self.assertTrue(first_result)
+        self.assertTrue(second_result)
+        self.assertEqual(mock_get.call_args.kwargs['headers'], {'If-None-Match': '"mempool-1"'})
+
+    @patch('btc_parser._session.get')
+    def test_scan_mempool(self, mock_get):
+        # Set up the mock response to return a JSON dictionary with a transaction
+        # from the first to the second monitored address
+        mock_get.return_value.content = orjson.dumps({
+            'txs': [{
+                'inputs': [{
+                    'prev_out': {
+                        'addr': 'first_address'
+                    }
+                }],
+                'out': [{
+                    'addr': 'second_address'
+                }, {
+                    'value': 1000
+                }]
+            }]
+        })
+
+        # Call the function with all monitored addresses
+        tx_hits, rx_hits = BtcAddressMonitoring.scan_mempool({'first_address', 'second_address', 'third_address'})
+
+        # Assert that each monitored address is reported with its direction and that the memory pool was requested once
+        self.assertEqual(tx_hits, {'first_address': True, 'second_address': False, 'third_address': False})
+        self.assertEqual(rx_hits, {'first_address': False, 'second_address': True, 'third_address': False})
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_watch_stream(self):
+        # Set up a WebSocket connection that sends a binary message and a notification without a transaction,
+        # followed by transactions where the watchAddress sends BTC, receives BTC, receives BTC in a transaction
+        # without inputs, and does not send or receive BTC
+        websocket = FakeWebSocket([
+            SimpleNamespace(type=aiohttp.WSMsgType.BINARY, data=b'{}'),
+            SimpleNamespace(type=aiohttp.WSMsgType.TEXT, data='{"op": "pong"}'),
+            utx_message({'inputs': [{'prev_out': {'addr': 'watch_address'}}], 'out': [{'addr': 'other_address'}]}),
+            utx_message({'inputs': [{'prev_out': {'addr': 'other_address'}}], 'out': [{'addr': 'watch_address'}]}),
+            utx_message({'inputs': [], 'out': [{'addr': 'watch_address'}]}),
+            utx_message({'inputs': [{'prev_out': {'addr': 'other_address'}}], 'out': [{'addr': 'other_address'}]})
+        ])
+        client_session = FakeClientSession(websocket)
+
+        # Collect the results of the stream with the watchAddress until the server closes the connection
+        results = []
+
+        async def collect_results():
+            async for is_tx, is_rx, _ in test_monitor.watch_stream(client_session):
+                results.append((is_tx, is_rx))
+
+        with self.assertRaises(ConnectionError):
+            asyncio.run(collect_results())
+
+        # Assert that only the matching transactions are reported with their direction
+        self.assertEqual(results, [(True, False), (False, True), (False, True)])
+
+        # Assert that the notifications were subscribed and that the passed session was not closed
+        self.assertEqual(websocket.sent, [{"op": "unconfirmed_sub"}])
+        self.assertFalse(client_session.closed)
+
+    def test_watch_stream_error(self):
+        # Set up a WebSocket connection that fails after a transaction where the watchAddress sends BTC
+        error = aiohttp.ClientError("Connection reset")
+        websocket = FakeWebSocket([
+            utx_message({'inputs': [{'prev_out': {'addr': 'watch_address'}}], 'out': [{'addr': 'other_address'}]}),
+            SimpleNamespace(type=aiohttp.WSMsgType.ERROR, data=error),
+            utx_message({'inputs': [{'prev_out': {'addr': 'other_address'}}], 'out': [{'addr': 'watch_address'}]})
+        ], error=error)
+        client_session = FakeClientSession(websocket)
+
+        # Collect the results of the stream with the watchAddress
+        results = []
+
+        async def collect_results():
+            async for is_tx, is_rx, _ in test_monitor.watch_stream(client_session):
+                results.append((is_tx, is_rx))
+
+        # Assert that the error of the connection is raised and that no message after the error is processed
+        with self.assertRaises(aiohttp.ClientError) as context:
+            asyncio.run(collect_results())
+        self.assertIs(context.exception, error)
+        self.assertEqual(results, [(True, False)])
+
+    def test_passed_session(self):
+        # Set up a session whose response contains a transaction where the watchAddress sends BTC
+        session = MagicMock()
+        session.get.return_value.content = orjson.dumps({
+            'txs': [{
+                'inputs': [{
+                    'prev_out': {
+                        'addr': 'watch_address'
+                    }
+                }]
+            }]
+        })
+
+        # Call the function with a monitoring object that uses the passed session
+        result = BtcAddressMonitoring('watch_address', session=session).is_tx_transaction_from_btc_address()
+
+        # Assert that the function returns True and that the API request was sent with the passed session
+        self.assertTrue(result)
+        self.assertEqual(session.get.call_count, 1)
+
+    def test_separate_sessions(self):
+        # Set up two sessions whose memory pools differ - Only in the first one the watchAddress sends BTC
+        first_session = MagicMock()
+        first_session.get.return_value.content = orjson.dumps({
+            'txs': [{
+                'inputs': [{
+                    'prev_out': {
+                        'addr': 'watch_address'
+                    }
+                }]
+            }]
+        })
+        second_session = MagicMock()
+        second_session.get.return_value.content = orjson.dumps({
+            'txs': [{
+                'inputs': [{
+                    'prev_out': {
+                        'addr': 'other_address'
+                    }
+                }]
+            }]
+        })
+
+        # Call the function with a monitoring object per session
+        first_monitor = BtcAddressMonitoring('watch_address', session=first_session)
+        second_monitor = BtcAddressMonitoring('watch_address', session=second_session)
+        first_result = first_monitor.is_tx_transaction_from_btc_address()
+        second_result = second_monitor.is_tx_transaction_from_btc_address()
+
+        # Assert that each session requested and used its own memory pool
+        self.assertTrue(first_result)
+        self.assertFalse(second_result)
+        self.assertEqual(first_session.get.call_count, 1)
+        self.assertEqual(second_session.get.call_count, 1)
+
+    @patch('btc_parser._session.get')
+    def test_invalid_mempool_ttl(self, mock_get):
+        # Assert that a disabled or too long cache time is rejected before the memory pool is requested
+        with self.assertRaises(ValueError):
+            BtcAddressMonitoring('watch_address', mempool_ttl=0)
+        with self.assertRaises(ValueError):
+            BtcAddressMonitoring.scan_mempool({'watch_address'}, ttl=3600)
+        self.assertEqual(mock_get.call_count, 0)
+
+    @patch('btc_parser._session.get')
     def test_api_error(self, mock_get):
         # Set up the mock to raise an exception when called
         mock_get.side_effect = Exception
@@ -99,6 +347,9 @@ class TestBtcAddressMonitoring(unittest.TestCase):
         self.assertFalse(rx_result)
 
     def setUp(self):
+        # Discard the lists of unconfirmed transactions cached by a previous test
+        _mempool_caches.clear()
+
         # Set up test data and mock objects as needed
         self.watch_address = "3MCMZjWAMdGqAhi1iF1oyiiE2jY5yBAYzV"
         self.transaction_list = []
@@ -138,10 +389,10 @@ class TestBtcAddressMonitoring(unittest.TestCase):
             "n_tx": 2
         }
 
-    @patch("requests.get")
+    @patch('btc_parser._session.get')
     def test_get_transactions_success(self, mock_get):
         # Test the function when the API request is successful
-        mock_get.return_value.json.return_value = self.mock_response
+        mock_get.return_value.content = orjson.dumps(self.mock_response)
         mock_get.return_value.raise_for_status.return_value = None
         expected_result = [
             ("1F1tAaz5x1HUXrCNLbtMDqcw6o5GNn4xqX", "1F1tAaz5x1HUXrCNLbtMDqcw6o5GNn4xqX", 1000000),
@@ -154,9 +405,74 @@ class TestBtcAddressMonitoring(unittest.TestCase):
         # Assert that the function returns the expected result
         self.assertEqual(result, expected_result)
 
-    @patch("requests.get")
+    @patch('btc_parser._session.get')
+    def test_get_transactions_pagination(self, mock_get):
+        # Set up the mock to return one transaction per page, with the offset of the page as amount
+        def get_page(api_url, timeout):
+            offset = int(api_url.split("offset=")[1])
+            response = MagicMock()
+            response.content = orjson.dumps({
+                "txs": [
+                    {
+                        "inputs": [
+                            {
+                                "prev_out": {
+                                    "addr": "1F1tAaz5x1HUXrCNLbtMDqcw6o5GNn4xqX"
+                                }
+                            }
+                        ],
+                        "out": [
+                            {
+                                "addr": "1F1tAaz5x1HUXrCNLbtMDqcw6o5GNn4xqX",
+                                "value": offset + 1
+                            }
+                        ]
+                    }
+                ],
+                "n_tx": 120
+            })
+            return response
+
+        mock_get.side_effect = get_page
+        expected_result = [
+            ("1F1tAaz5x1HUXrCNLbtMDqcw6o5GNn4xqX", "1F1tAaz5x1HUXrCNLbtMDqcw6o5GNn4xqX", 1),
+            ("1F1tAaz5x1HUXrCNLbtMDqcw6o5GNn4xqX", "1F1tAaz5x1HUXrCNLbtMDqcw6o5GNn4xqX", 51),
+            ("1F1tAaz5x1HUXrCNLbtMDqcw6o5GNn4xqX", "1F1tAaz5x1HUXrCNLbtMDqcw6o5GNn4xqX", 101)
+        ]
+
+        # Call the function being tested
+        result = test_monitor.get_transactions_from_btc_address()
+
+        # Assert that all pages were requested and merged in the order of the pages
+        self.assertEqual(result, expected_result)
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch('btc_parser._session.get')
+    def test_get_transactions_page_error(self, mock_get):
+        # Set up the mock to report 100 pages and to fail for the second page
+        # All other pages are answered with a delay, so that the failure is noticed while pages are pending
+        def get_page(api_url, timeout):
+            response = MagicMock()
+            if api_url.endswith("offset=50"):
+                response.raise_for_status.side_effect = requests.exceptions.HTTPError
+            elif not api_url.endswith("offset=0"):
+                time.sleep(0.05)
+            response.content = orjson.dumps({"txs": [], "n_tx": 5000})
+            return response
+
+        mock_get.side_effect = get_page
+
+        # Call the function being tested
+        result = test_monitor.get_transactions_from_btc_address()
+
+        # Assert that an empty list is returned and that the pending pages were not requested
+        self.assertEqual(result, [])
+        self.assertLess(mock_get.call_count, 100)
+
+    @patch('btc_parser._session.get')
     def test_get_transactions_api_error(self, mock_get):
         # Test the function when the API request returns an error
+        mock_get.return_value.ok = False
         mock_get.return_value.raise_for_status.side_effect = requests.exceptions.RequestException
         expected_result = []
 
@@ -166,7 +482,7 @@ class TestBtcAddressMonitoring(unittest.TestCase):
         # Assert that the function returns an empty list when the API request fails
         self.assertEqual(result, expected_result)
 
-    @patch("requests.get")
+    @patch('btc_parser._session.get')
     def test_get_transactions_invalid_data(self, mock_get):
         # Test the function when the API response contains transactions without input or output addresses or amounts
         mock_response = {
@@ -206,7 +522,7 @@ class TestBtcAddressMonitoring(unittest.TestCase):
                 }
             ]
         }
-        mock_get.return_value.json.return_value = mock_response
+        mock_get.return_value.content = orjson.dumps(mock_response)
         mock_get.return_value.raise_for_status.return_value = None
         expected_result = []
 
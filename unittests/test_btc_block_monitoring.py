@@ -0,0 +1,181 @@
+#############################################################
+# @file     test_btc_block_monitoring.py
+# @author   criticalEntropy
+# @date     15.10.2026
+#############################################################
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from btc_parser import BtcBlockMonitoring
+import orjson
+import requests
+
+
+class TestBtcBlockMonitoring(unittest.TestCase):
+
+    def setUp(self):
+        # Set up test data as needed
+        self.block_data = {
+            "tx": [
+                {
+                    "inputs": [
+                        {
+                            "prev_out": {
+                                "addr": "sender_address_1",
+                                "value": 3000
+                            }
+                        },
+                        {
+                            "prev_out": {
+                                "addr": "sender_address_2",
+                                "value": 1000
+                            }
+                        },
+                        {
+                            "prev_out": {
+                                "addr": "sender_address_3",
+                                "value": 4000
+                            }
+                        }
+                    ],
+                    "out": [
+                        {
+                            "addr": "recipient_address_1",
+                            "value": 4000
+                        },
+                        {
+                            "addr": "recipient_address_2",
+                            "value": 4000
+                        }
+                    ]
+                },
+                {
+                    "inputs": [
+                        {
+                            "prev_out": {
+                                "addr": "sender_address_4",
+                                "value": 5000
+                            }
+                        }
+                    ],
+                    "out": [
+                        {
+                            "addr": "recipient_address_3",
+                            "value": 2500
+                        },
+                        {
+                            "addr": "recipient_address_4",
+                            "value": 2500
+                        }
+                    ]
+                }
+            ]
+        }
+
+    @patch('btc_parser._session.get')
+    def test_get_mixed_btc_transactions(self, mock_get):
+        # Set up the mock response to return a block with a CoinJoin transaction with three inputs and two outputs
+        # and a transaction with only one input that is not a CoinJoin
+        mock_get.return_value.content = orjson.dumps(self.block_data)
+        expected_result = [
+            ("sender_address_1", "recipient_address_1", 1500),
+            ("sender_address_1", "recipient_address_2", 1500),
+            ("sender_address_2", "recipient_address_1", 500),
+            ("sender_address_2", "recipient_address_2", 500),
+            ("sender_address_3", "recipient_address_1", 2000),
+            ("sender_address_3", "recipient_address_2", 2000)
+        ]
+
+        # Call the function being tested
+        block_monitor = BtcBlockMonitoring(1, 1)
+        result = block_monitor.get_mixed_btc_transactions_from_btc_blocks()
+
+        # Assert that each input is paired with each output of the CoinJoin transaction
+        self.assertEqual(list(result), expected_result)
+
+        # Assert that the rows can be counted and indexed like a list
+        self.assertEqual(len(result), len(expected_result))
+        self.assertEqual(result[0], expected_result[0])
+        self.assertEqual(result[-1], expected_result[-1])
+        self.assertEqual(result[1:3], expected_result[1:3])
+
+        # Assert that the columns contain the same transaction data
+        sender_addresses, recipient_addresses, amounts = block_monitor.columns()
+        self.assertEqual(sender_addresses, [sender_address for sender_address, _, _ in expected_result])
+        self.assertEqual(recipient_addresses, [recipient_address for _, recipient_address, _ in expected_result])
+        self.assertEqual(amounts.tolist(), [amount for _, _, amount in expected_result])
+
+    @patch('btc_parser._session.get')
+    def test_get_mixed_btc_transactions_rows(self, mock_get):
+        # Set up the mock response to return the same block for a block range of two blocks
+        mock_get.return_value.content = orjson.dumps(self.block_data)
+
+        # Call the function being tested and use the result as rows
+        block_monitor = BtcBlockMonitoring(1, 2)
+        total_amount = 0
+        for sender_address, recipient_address, amount in block_monitor.get_mixed_btc_transactions_from_btc_blocks():
+            self.assertTrue(sender_address.startswith("sender_address_"))
+            self.assertTrue(recipient_address.startswith("recipient_address_"))
+            total_amount += amount
+
+        # Assert that the outputs of the CoinJoin transaction of both blocks are split among the inputs
+        self.assertEqual(total_amount, 2 * 8000)
+        self.assertEqual(len(block_monitor.matrix), 12)
+
+    @patch('btc_parser._session.get')
+    def test_get_mixed_btc_transactions_partial_error(self, mock_get):
+        # Set up the mock response to return the block data for all blocks except the second block
+        def get_block(api_url, timeout):
+            response = MagicMock()
+            if api_url.endswith("/2"):
+                response.raise_for_status.side_effect = requests.exceptions.HTTPError
+            response.content = orjson.dumps(self.block_data)
+            return response
+
+        mock_get.side_effect = get_block
+
+        # Call the function being tested and assert that the error is raised
+        block_monitor = BtcBlockMonitoring(1, 3)
+        with self.assertRaises(requests.exceptions.RequestException):
+            block_monitor.get_mixed_btc_transactions_from_btc_blocks()
+
+        # Assert that the transactions of the successful blocks are not stored as an incomplete result
+        self.assertEqual(list(block_monitor.matrix), [])
+
+    @patch('btc_parser._session.get')
+    def test_get_mixed_btc_transactions_parse_error(self, mock_get):
+        # Set up the mock response to return a response that is not a JSON dictionary for the first block
+        def get_block(api_url, timeout):
+            response = MagicMock()
+            response.content = b"Rate limited" if api_url.endswith("/1") else orjson.dumps(self.block_data)
+            return response
+
+        mock_get.side_effect = get_block
+
+        # Call the function being tested and assert that the error is raised
+        block_monitor = BtcBlockMonitoring(1, 1000)
+        with self.assertRaises(ValueError):
+            block_monitor.get_mixed_btc_transactions_from_btc_blocks()
+
+        # Assert that the pending blocks are cancelled and no transactions are stored
+        self.assertLess(mock_get.call_count, 1000)
+        self.assertEqual(len(block_monitor.matrix), 0)
+
+    @patch('btc_parser._session.get')
+    def test_get_mixed_btc_transactions_api_error(self, mock_get):
+        # Set up the mock response to return an error
+        mock_get.return_value.ok = False
+        mock_get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError
+
+        # Call the function being tested and assert that the error is raised
+        block_monitor = BtcBlockMonitoring(1, 3)
+        with self.assertRaises(requests.exceptions.RequestException):
+            block_monitor.get_mixed_btc_transactions_from_btc_blocks()
+
+        # Assert that no transactions are stored when the API request fails
+        self.assertEqual(list(block_monitor.matrix), [])
+
+
+if __name__ == '__main__':
+    unittest.main()